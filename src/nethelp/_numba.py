@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2024-present Nima Moghaddas <n.r.moghaddas@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Optional Numba support.
+
+Numba is not a required dependency. When it is installed, `njit` and `prange` are
+Numba's own; otherwise `njit` leaves the function as plain Python and `prange` is
+`range`, and callers should check `HAVE_NUMBA` to pick their NumPy/SciPy path instead.
+"""
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,5 +1,153 @@
+import contextlib
+import functools
+import inspect
+import weakref
+from collections import namedtuple
+
 import numpy as np
 import networkx as nx
+import scipy.sparse as sp
+import scipy.linalg as la
+from scipy.linalg import blas
+import scipy.sparse.linalg as spla
+from scipy.sparse import csgraph
+
+from ._numba import HAVE_NUMBA, njit, prange
+
+# Below these sizes dense LAPACK routines beat their sparse counterparts and the
+# n x n dense copy is small, so Katz centrality switches to the dense path.
+_DENSE_SOLVE_MAX_NODES = 500
+_DENSE_EIG_MAX_NODES = 100
+# Above this many nodes method='solve' uses conjugate gradient: the fill-in of a sparse LU
+# grows much faster than |E| on heavy-tailed graphs (BA graph, 10^4 nodes: ~7e6 factor entries).
+_DIRECT_SOLVE_MAX_NODES = 5000
+
+# SciPy 1.12 renamed the relative tolerance of its Krylov solvers from `tol` to `rtol`
+_CG_RTOL = 'rtol' if 'rtol' in inspect.signature(spla.cg).parameters else 'tol'
+
+# With backend='auto', graphs with more edges than this run on the GPU via cugraph
+# (if installed); below it the host-to-device copy outweighs the faster SpMV.
+_CUGRAPH_MIN_EDGES = 1_000_000
+
+@functools.lru_cache(maxsize=None)
+def _cugraph():
+    """The RAPIDS cugraph module, or None if it is not installed (imported once)."""
+    try:
+        import cugraph
+    except ImportError:
+        return None
+    return cugraph
+
+def _use_cugraph(backend, G):
+    """
+    Whether to run a centrality calculation on the GPU for backend='auto'|'cugraph'|'cpu'.
+    """
+    if backend not in ('auto', 'cugraph', 'cpu'):
+        raise ValueError("backend must be one of 'auto', 'cugraph' or 'cpu'")
+    if backend == 'cpu':
+        return False
+    if _cugraph() is None:
+        if backend == 'cugraph':
+            raise ImportError("backend='cugraph' requires the RAPIDS cugraph package")
+        return False
+    return backend == 'cugraph' or G.number_of_edges() > _CUGRAPH_MIN_EDGES
+
+def _cugraph_input(G, weight=None):
+    """
+    Simple copy of G to hand to cugraph, so the GPU scores the same matrix as the CPU.
+
+    cugraph reads the 'weight' attribute of each edge; here it is set to the `weight`
+    attribute of G (1 if weight is None), summed over parallel edges only when weighted,
+    as in `_graph_arrays`. For directed graphs cugraph scores nodes by their in-edges,
+    whereas the CPU path sums over out-neighbours (x <- A x), so directed edges are reversed.
+    """
+    directed = G.is_directed()
+    H = nx.DiGraph() if directed else nx.Graph()
+    H.add_nodes_from(G)
+    edges = G.edges(data=weight, default=1) if weight is not None else ((u, v, 1) for u, v in G.edges())
+    for u, v, w in edges:
+        if directed:
+            u, v = v, u
+        if weight is not None and H.has_edge(u, v): # parallel edge of a multigraph
+            H[u][v]['weight'] += w
+        else:
+            H.add_edge(u, v, weight=w)
+    return H
+
+GraphArrays = namedtuple('GraphArrays', ['nodes', 'index', 'A', 'indptr', 'indices'])
+
+# graph -> {(number of nodes, number of edges, weight): GraphArrays} while a
+# use_graph_cache() block is active, otherwise None (no caching)
+_GRAPH_CACHE = None
+
+def _graph_arrays(G, weight=None):
+    """
+    Node order, node -> position mapping and float64 CSR adjacency matrix of G.
+
+    G is converted on every call, unless inside a `use_graph_cache()` block, where the
+    result is cached per graph (and node count, edge count and weight) so that repeated
+    calls on the same graph only convert it once. Cached arrays are shared and must not
+    be modified in place.
+    """
+    if _GRAPH_CACHE is None:
+        return _to_graph_arrays(G, weight)
+    key = (G.number_of_nodes(), G.number_of_edges(), weight)
+    cached = _GRAPH_CACHE.setdefault(G, {})
+    if key not in cached:
+        cached[key] = _to_graph_arrays(G, weight)
+    return cached[key]
+
+def _to_graph_arrays(G, weight):
+    nodes = tuple(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, dtype=np.float64, format='csr')
+    if weight is None:
+        A.data[:] = 1 # a multigraph's parallel edges count once, as in G[node]
+    return GraphArrays(nodes, index, A, A.indptr, A.indices)
+
+@contextlib.contextmanager
+def use_graph_cache():
+    """
+    Context manager that caches each graph's sparse adjacency matrix between calls.
+
+    By default every centrality, shortest path and CSR search function converts its
+    graph to a sparse matrix on each call. Inside this block the conversion is done
+    once per graph and reused, which pays off when several of them are run on the same
+    (large) graph. Graphs are only weakly referenced, and the cache is emptied when the
+    outermost block exits.
+
+    The cache notices added or removed nodes and edges, but not changes that keep both
+    counts the same (e.g. rewiring an edge or changing a weight): call
+    `clear_graph_cache()` after such changes inside the block.
+
+    Examples
+    --------
+    >>> G = nx.karate_club_graph()
+    >>> with use_graph_cache():
+    ...     closeness = closeness_centrality(G)
+    ...     eigenvector = eigenvector_centrality(G) # reuses G's adjacency matrix
+    """
+    global _GRAPH_CACHE
+    if _GRAPH_CACHE is not None: # nested block: keep using the outer cache
+        yield
+        return
+    _GRAPH_CACHE = weakref.WeakKeyDictionary()
+    try:
+        yield
+    finally:
+        _GRAPH_CACHE = None
+
+def clear_graph_cache():
+    """
+    Clear the adjacency matrices cached inside the current `use_graph_cache()` block.
+
+    Needed only if a graph is modified without changing its number of nodes or edges
+    (e.g. rewiring an edge or changing a weight) and then passed to one of the
+    functions in this module again within the same block.
+    """
+    if _GRAPH_CACHE is not None:
+        _GRAPH_CACHE.clear()
+
 def degree_distribution(G, number_of_bins=15, log_binning=True, density=True, directed=False):
     """
     Given a degree sequence, return the y values (probability) and the
@@ -35,9 +183,9 @@ def degree_distribution(G, number_of_bins=15, log_binning=True, density=True, di
     # Step 0: Do we want the directed or undirected degree distribution?
     if directed:
         if directed=='in':
-            k = list(dict(G.in_degree()).values()) # get the in degree of each node
+            degrees = G.in_degree() # get the in degree of each node
         elif directed=='out':
-            k = list(dict(G.out_degree()).values()) # get the out degree of each node
+            degrees = G.out_degree() # get the out degree of each node
         else:
             out_error = "Help! if directed!=False, the input needs to be either 'in' or 'out'"
             print(out_error)
@@ -45,7 +193,8 @@ def degree_distribution(G, number_of_bins=15, log_binning=True, density=True, di
             #           See "raise" function...
             return out_error
     else:
-        k = list(dict(G.degree()).values()) # get the degree of each node
+        degrees = G.degree() # get the degree of each node
+    k = np.fromiter((d for _, d in degrees), dtype=np.int64, count=G.number_of_nodes())
 
 
     # Step 1: We will first need to define the support of our distribution
@@ -61,8 +210,17 @@ def degree_distribution(G, number_of_bins=15, log_binning=True, density=True, di
         bins = np.linspace(0, kmax+1, num=number_of_bins+1)
 
 
-    # Step 3: Then we can compute the histogram using numpy
-    probs, _ = np.histogram(k, bins, density=density)
+    # Step 3: Then we can compute the histogram. Degrees are small non-negative
+    #         integers, so count each degree once with bincount (O(N)) and then
+    #         sum the slice of counts falling in each bin. Bins are half-open
+    #         [left, right) except the last, which is closed, as in np.histogram.
+    counts = np.bincount(k, minlength=kmax+1)
+    cumulative = np.concatenate(([0], np.cumsum(counts)))
+    edge_idx = np.clip(np.ceil(bins), 0, kmax+1).astype(np.int64)
+    edge_idx[-1] = np.clip(np.floor(bins[-1]) + 1, 0, kmax+1)
+    probs = np.diff(cumulative[edge_idx])
+    if density:
+        probs = probs / np.diff(bins) / probs.sum()
 
 
     # Step 4: Return not the "bins" but the midpoint between adjacent bin
@@ -71,7 +229,7 @@ def degree_distribution(G, number_of_bins=15, log_binning=True, density=True, di
     
     return bins_out, probs
 
-def calculate_katz_centrality(G, alpha, node = None):
+def calculate_katz_centrality(G, alpha, node = None, method='solve', max_iter=1000, tol=1e-06, x0=None, backend='auto'):
     """
     Calculate the Katz centrality for each node in the graph G.
     
@@ -82,7 +240,7 @@ def calculate_katz_centrality(G, alpha, node = None):
     Parameters
     ----------
     G : nx.Graph
-        The input graph, which must be a NetworkX graph (either directed or undirected).
+        The input graph, which must be an undirected NetworkX graph.
     
     alpha : float
         The attenuation factor, which controls the weight given to longer paths. 
@@ -92,6 +250,35 @@ def calculate_katz_centrality(G, alpha, node = None):
         A specific node in the graph for which to return the Katz centrality. 
         If provided, the function returns the centrality of this node only. 
         If not provided, the function returns the Katz centrality for all nodes in the graph.
+
+    method : str, optional (default = 'solve')
+        How to compute the centrality vector. 'solve' solves the sparse linear system
+        (I - alpha * A) x = 1 directly, switching to the 'iterative' solver for graphs with
+        more than 5000 nodes; 'power' iterates x <- alpha * A x + 1 until convergence,
+        which only needs sparse matrix-vector products; 'iterative' solves the system with
+        Jacobi-preconditioned conjugate gradient, which avoids
+        the fill-in of a factorization and keeps memory at O(|E|) on very large graphs.
+
+    max_iter : int, optional (default = 1000)
+        Maximum number of iterations when method='power' or method='iterative' (and for
+        'solve' on graphs large enough to use the iterative solver).
+
+    tol : float, optional (default = 1e-06)
+        Convergence tolerance on the change in x between iterations when method='power',
+        or on the relative residual when the iterative solver is used.
+
+    x0 : np.ndarray, optional (default = None)
+        Starting guess when method='iterative', e.g. the result of a previous call on a
+        slightly modified graph (warm start). It is rescaled before use, so a normalized
+        result can be passed as is.
+
+    backend : str, optional (default = 'auto')
+        'cpu' always uses the methods above. 'cugraph' runs the calculation on the GPU with
+        `cugraph.katz_centrality` (method and x0 are then ignored). 'auto' uses cugraph only
+        if it is installed and G has more than 10^6 edges, where the GPU's memory bandwidth
+        outweighs the cost of copying the graph to the device. G is still converted to a CSR
+        matrix and alpha is checked against its leading eigenvalue (ARPACK) on the CPU first,
+        so the GPU path does not avoid that host-side cost.
     
     Returns
     -------
@@ -104,13 +291,23 @@ def calculate_katz_centrality(G, alpha, node = None):
     TypeError
         If G is not a valid NetworkX graph.
 
+    NetworkXNotImplemented
+        If G is directed.
+
     IndexError
         If specified node does not exist in G.
     
     ValueError
         If alpha is not smaller than the reciprocal of the largest eigenvalue of the adjacency matrix of G, 
-        as Katz centrality does not converge in this case.
-    
+        as Katz centrality does not converge in this case, or if method is not 'solve', 'power'
+        or 'iterative', or backend is not 'auto', 'cugraph' or 'cpu'.
+
+    ImportError
+        If backend='cugraph' and cugraph is not installed.
+
+    Exception
+        If method='power' or method='iterative' does not converge within max_iter iterations.
+
     Warnings
     --------
     - A warning is printed if the graph is not connected, as Katz centrality's interpretation is not well-defined for disconnected graphs.
@@ -123,7 +320,13 @@ def calculate_katz_centrality(G, alpha, node = None):
         C_katz = (I - alpha * A)^-1 * 1
     
     where I is the identity matrix, A is the adjacency matrix, and 1 is a vector of ones.
-    
+
+    A is kept in sparse (CSR) form throughout: the leading eigenvalue is found with ARPACK
+    and the inverse is never formed. 'power' and 'iterative' need O(|E|) memory; the LU factors
+    used by 'solve' can fill in well beyond |E|, which is why large graphs are solved with CG.
+    For graphs with 100 or more nodes that eigenvalue is an estimate with a relative tolerance
+    of 1e-4, so an alpha within that tolerance of its upper bound may not be rejected.
+
     The centrality values are normalized by dividing each node's Katz centrality by the maximum value among all nodes.
 
     Examples
@@ -136,12 +339,67 @@ def calculate_katz_centrality(G, alpha, node = None):
     1.0
     """
     #warning = None
+    if method not in ('solve', 'power', 'iterative'):
+        raise ValueError("method must be one of 'solve', 'power' or 'iterative'")
+
+    if _use_cugraph(backend, G):
+        arrays = _katz_adjacency(G, alpha) # same checks as on the CPU
+        nodes = arrays.nodes
+        katz = _cugraph().katz_centrality(_cugraph_input(G, 'weight'), alpha=alpha, max_iter=max_iter, tol=tol) # dict for nx input
+        katz_centrality = np.array([katz[v] for v in nodes], dtype=np.float64)
+        katz_normalized = katz_centrality/np.max(katz_centrality) # normalize by largest value
+    elif method == 'solve' and len(G) <= _DIRECT_SOLVE_MAX_NODES:
+        return KatzSolver(G, alpha).centrality(node) # LU-factorize and solve (I - alpha*A) x = 1
+    else:
+        arrays = _katz_adjacency(G, alpha)
+        A = arrays.A # validated sparse (CSR) adjacency matrix A
+        n = A.shape[0]
+        ones = np.ones(n) # create vector of ones of same length as A
+        if method == 'power':
+            katz_centrality = ones
+            for _ in range(max_iter):
+                katz_new = alpha * (A @ katz_centrality) + ones
+                converged = np.linalg.norm(katz_new - katz_centrality) < tol
+                katz_centrality = katz_new
+                if converged:
+                    break
+            else:
+                raise Exception('Power iteration did not converge within max_iter iterations')
+        else:
+            M = sp.identity(n, format='csr') - alpha * A # (I - alpha*A) is SPD for valid alpha
+            jacobi = sp.diags(1.0 / M.diagonal()) # Jacobi (diagonal) preconditioner
+            if x0 is not None: # rescale the (normalized) guess to best fit M x = 1
+                x0 = np.asarray(x0, dtype=np.float64)
+                Mx0 = M @ x0
+                x0 = x0 * (Mx0.sum() / Mx0.dot(Mx0))
+            katz_centrality, info = spla.cg(M, ones, x0=x0, maxiter=max_iter, M=jacobi, atol=0.0,
+                                            **{_CG_RTOL: tol})
+            if info != 0:
+                raise Exception('Iterative solver did not converge within max_iter iterations')
+        katz_normalized = katz_centrality/np.max(katz_centrality) # normalize by largest value
+    if node is not None:
+        if node not in G:
+            raise IndexError("Node must be in graph G")
+        katz_node = float(katz_normalized[arrays.index[node]]) # extract centrality of specified node
+        return(katz_node)
+    else:
+        return(katz_normalized)
+
+def _katz_adjacency(G, alpha):
+    """
+    Build the sparse (CSR) adjacency matrix of G and check that Katz centrality is
+    well defined for it: G is a NetworkX graph, has some connectivity, is connected,
+    and alpha is below the reciprocal of the leading eigenvalue. Returns the
+    weighted `GraphArrays` of G.
+    """
     if not isinstance(G, nx.Graph): # raise error if G is not nx.Graph
         raise TypeError("G must be a NetworkX graph")
+    if G.is_directed(): # nx.is_connected below is undefined for directed graphs
+        raise nx.NetworkXNotImplemented("Katz centrality is only implemented for undirected graphs")
 
-    A = nx.adjacency_matrix(G).toarray() # convert G into adjacency matrix A
-    eigvals = np.linalg.eigvals(A) # calculate the eigenvalues of A
-    max_eigval = max(abs(val) for val in eigvals) # find the leading eigenvalue of A
+    arrays = _graph_arrays(G, weight='weight')
+    A = arrays.A # sparse (CSR) adjacency matrix A
+    max_eigval = _leading_eigenvalue(A) # find the leading eigenvalue of A
     if max_eigval == 0: # check for unconnected graph
         raise Exception('Graph has no connectivity')
         
@@ -152,17 +410,246 @@ def calculate_katz_centrality(G, alpha, node = None):
         raise Exception('Graph is disconnected. Interpretation of Katz centrality is not clear for disconnected graphs')
         # todo: calculate katz on disconnected subgraphs seperately
 
-    I = np.eye(len(G)) # create the identity matrix of same size as A
-    ones = np.array([1]*len(A)) # create vector of ones of same length as A
-    katz_centrality = np.linalg.inv(I - alpha * A) @ ones # calculate katz centrality
-    katz_normalized = katz_centrality/max(katz_centrality) # normalize by largest value
-    if node:
-        if node not in list(G.nodes()):
+    return arrays
+
+class KatzSolver:
+    """
+    Katz centrality of a graph from a single sparse LU factorization of (I - alpha * A).
+
+    Factorizing once lets the centrality be queried repeatedly (for the whole graph or
+    one node at a time) without repeating the factorization, and lets single-edge
+    changes be folded in with Sherman-Morrison rank-1 corrections instead of refactoring.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        The input graph, which must be an undirected NetworkX graph.
+
+    alpha : float
+        The attenuation factor. Must be less than the reciprocal of the largest
+        eigenvalue of the adjacency matrix of G.
+
+    Raises
+    ------
+    TypeError
+        If G is not a valid NetworkX graph.
+
+    NetworkXNotImplemented
+        If G is directed.
+
+    ValueError
+        If alpha is not smaller than the reciprocal of the largest eigenvalue of the
+        adjacency matrix of G.
+
+    Notes
+    -----
+    Adding an edge u -> v with weight w changes the system matrix by
+    -alpha * w * e_u e_v^T, so with M_k the matrix after k updates,
+
+        M_k^-1 b = M_{k-1}^-1 b - z_k (e_v^T M_{k-1}^-1 b) / (1 + e_v^T z_k),
+        z_k = M_{k-1}^-1 (-alpha * w * e_u).
+
+    Each update costs one solve; each later solve costs one LU solve plus O(n) per
+    update. Graphs with fewer than 500 nodes are factorized densely with LAPACK, which
+    is faster at that size; larger graphs use SuperLU on the sparse matrix. The
+    spectral-radius condition on alpha is only checked for the original graph, and G
+    itself is never modified.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> solver = KatzSolver(G, alpha=0.1)
+    >>> solver.centrality(node=2)
+    1.0
+    >>> solver.update_edge(0, 4)  # close the path into a cycle
+    >>> solver.centrality()
+    array([1., 1., 1., 1., 1.])
+    """
+    def __init__(self, G, alpha):
+        arrays = _katz_adjacency(G, alpha)
+        A = arrays.A
+        self.alpha = alpha
+        self.n = A.shape[0]
+        self._index = arrays.index
+
+        M = sp.identity(self.n, format='csc') - alpha * A # sparse (I - alpha*A)
+        if self.n < _DENSE_SOLVE_MAX_NODES: # factorize once
+            lu = la.lu_factor(M.toarray())
+            self._lu_solve = lambda b: la.lu_solve(lu, b)
+        else:
+            # M is symmetric with a dominant diagonal: order A + A^T and pivot on the diagonal
+            self._lu_solve = spla.splu(M.tocsc(), permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0,
+                                       options={'SymmetricMode': True}).solve
+        self._updates = [] # (z_k, column index v, denominator) for each rank-1 update
+        self._katz = None # cached normalized centrality vector
+
+    def solve(self, b):
+        """
+        Solve (I - alpha * A) x = b, including any edges added with `update_edge`.
+
+        Parameters
+        ----------
+        b : np.ndarray
+            Right-hand side of length n.
+
+        Returns
+        -------
+        x : np.ndarray
+            The solution vector.
+        """
+        x = self._lu_solve(np.asarray(b, dtype=np.float64))
+        for z, v, denom in self._updates:
+            x -= z * (x[v] / denom)
+        return x
+
+    def centrality(self, node=None):
+        """
+        Normalized Katz centrality of every node, or of a single node.
+
+        Parameters
+        ----------
+        node : object, optional (default = None)
+            If provided, return the Katz centrality of this node only.
+
+        Returns
+        -------
+        katz_centrality : np.ndarray or float
+            Centralities in the order of G's nodes, normalized by the largest value
+            (a new array on every call), or a single float if `node` is specified.
+
+        Raises
+        ------
+        IndexError
+            If specified node does not exist in G.
+        """
+        if self._katz is None:
+            katz_centrality = self.solve(np.ones(self.n)) # calculate katz centrality
+            self._katz = katz_centrality/np.max(katz_centrality) # normalize by largest value
+        if node is not None:
+            if node not in self._index:
+                raise IndexError("Node must be in graph G")
+            return float(self._katz[self._index[node]])
+        return self._katz.copy()
+
+    def update_edge(self, u, v, weight=1.0):
+        """
+        Add an edge (or increase its weight) without refactorizing.
+
+        The edge is undirected, so this is applied in both directions, i.e. as two
+        rank-1 updates.
+
+        Parameters
+        ----------
+        u, v : object
+            Endpoints of the edge. Both must be nodes of the original graph.
+
+        weight : float, optional (default = 1.0)
+            Amount added to the adjacency matrix entry A[u, v] (and A[v, u]).
+
+        Raises
+        ------
+        IndexError
+            If u or v does not exist in G.
+        """
+        if u not in self._index or v not in self._index:
             raise IndexError("Node must be in graph G")
-        katz_node = katz_normalized[node] # extract centrality of specified node
-        return(katz_node)
-    else:
-        return(katz_normalized)
+        i, j = self._index[u], self._index[v]
+        pairs = [(i, j)] if i == j else [(i, j), (j, i)]
+        for row, col in pairs:
+            p = np.zeros(self.n)
+            p[row] = -self.alpha * weight # M changes by p e_col^T
+            z = self.solve(p)
+            self._updates.append((z, col, 1.0 + z[col]))
+        self._katz = None
+
+def _leading_eigenvalue(A, tol=1e-04):
+    """
+    Estimate of the magnitude of the leading eigenvalue of a symmetric sparse adjacency
+    matrix.
+
+    Uses ARPACK's `eigsh` to a relative
+    tolerance of `tol`, so only a handful of sparse matrix-vector products are needed;
+    if ARPACK does not converge, falls back to plain power iteration. Small matrices
+    (which ARPACK also cannot handle below n = 3) use an exact dense eigendecomposition.
+    """
+    n = A.shape[0]
+    if A.nnz == 0:
+        return 0.0
+    if n < _DENSE_EIG_MAX_NODES:
+        eigvals = np.linalg.eigvalsh(A.toarray())
+        return float(np.max(np.abs(eigvals)))
+    try:
+        eigvals = spla.eigsh(A, k=1, which='LM', return_eigenvectors=False, tol=tol)
+    except spla.ArpackNoConvergence:
+        return _power_iteration_eigenvalue(A)
+    return float(np.max(np.abs(eigvals)))
+
+def _power_iteration_eigenvalue(A, max_iter=50):
+    """
+    Estimate |lambda_max| of A as ||A v|| after `max_iter` steps of power iteration
+    from a fixed random unit vector v.
+    """
+    v = np.random.default_rng(0).standard_normal(A.shape[0])
+    v /= np.linalg.norm(v)
+    for _ in range(max_iter):
+        v = A @ v
+        norm = np.linalg.norm(v)
+        if norm == 0:
+            return 0.0
+        v /= norm
+    return float(np.linalg.norm(A @ v))
+
+@njit(parallel=True, cache=True)
+def _bfs_distance_sums_kernel(indptr, indices, totals, reachable):
+    # One breadth-first search per source (in parallel over sources). The sum of
+    # distances is accumulated as nodes are discovered, so no distance table is kept.
+    n = len(indptr) - 1
+    for src in prange(n):
+        depth = np.full(n, -1, np.int64)
+        queue = np.empty(n, np.int64)
+        depth[src] = 0
+        queue[0] = src
+        head, tail, total = 0, 1, 0
+        while head < tail:
+            u = queue[head]
+            head += 1
+            d = depth[u] + 1
+            for jj in range(indptr[u], indptr[u + 1]):
+                v = indices[jj]
+                if depth[v] < 0:
+                    depth[v] = d
+                    total += d
+                    queue[tail] = v
+                    tail += 1
+        totals[src] = total
+        reachable[src] = tail
+
+def _distance_sums(G, block_size=1024):
+    """
+    Sum of unweighted shortest path lengths from each node of G (in `_graph_arrays`
+    order) to every node reachable from it, and the number of reachable nodes
+    (including the node itself).
+
+    With Numba installed, a compiled breadth-first search from every node runs over the
+    CSR arrays and sums distances layer by layer. Otherwise distances are computed by
+    `scipy.sparse.csgraph.shortest_path`, one block of source nodes at a time, so at
+    most a block_size x n array of distances is held in memory.
+    """
+    A = _graph_arrays(G).A
+    n = A.shape[0]
+    totals = np.zeros(n)
+    reachable = np.zeros(n, dtype=np.int64)
+    if HAVE_NUMBA:
+        _bfs_distance_sums_kernel(A.indptr, A.indices, totals, reachable)
+        return totals, reachable
+    for start in range(0, n, block_size):
+        sources = np.arange(start, min(start + block_size, n))
+        D = csgraph.shortest_path(A, method='D', directed=G.is_directed(),
+                                  unweighted=True, indices=sources)
+        finite = np.isfinite(D)
+        totals[sources] = np.where(finite, D, 0).sum(axis=1)
+        reachable[sources] = finite.sum(axis=1)
+    return totals, reachable
 
 def average_shortest_path_length_per_node(G):
     """
@@ -192,6 +679,10 @@ def average_shortest_path_length_per_node(G):
       for isolated nodes will exclude unreachable nodes.
     - The graph `G` can be directed or undirected, and the shortest path lengths are computed 
       accordingly.
+    - A node that cannot reach any other node has an average of NaN.
+    - The searches from every node are run in compiled code on the sparse adjacency 
+      matrix (a Numba kernel if Numba is installed, otherwise 
+      `scipy.sparse.csgraph.shortest_path`).
     
     Example:
     --------
@@ -199,19 +690,18 @@ def average_shortest_path_length_per_node(G):
     >>> average_shortest_path_length_per_node(G)
     {0: 2.0, 1: 1.5, 2: 1.0, 3: 1.5, 4: 2.0}
     """
-    avg_shortest_paths = {}
-    
-    # Compute shortest path lengths from each node to every other node
-    for node in G.nodes():
-        shortest_paths = nx.shortest_path_length(G, source=node)  # Dictionary of shortest paths from `node`
-        
-        # Compute the average shortest path length for the current node
-        total_length = sum(shortest_paths.values())  # Sum of shortest paths
-        num_nodes = len(shortest_paths)  # Number of reachable nodes
-        
-        avg_shortest_paths[node] = total_length / (num_nodes - 1)  # Exclude the node itself from the average
-    
-    return avg_shortest_paths
+    if len(G) == 0: # no adjacency matrix to build
+        return {}
+    nodes = _graph_arrays(G).nodes
+
+    # Sum of shortest path lengths and number of reachable nodes, for every node at once
+    total_length, num_nodes = _distance_sums(G)
+
+    # Compute the average shortest path length for each node
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_shortest_paths = total_length / (num_nodes - 1)  # Exclude the node itself from the average
+
+    return dict(zip(nodes, avg_shortest_paths.tolist()))
 
 def closeness_centrality(G):    
     """
@@ -239,7 +729,9 @@ def closeness_centrality(G):
     Notes
     -----
     - For each node, this function computes the sum of shortest path lengths to 
-      all other reachable nodes in the graph using NetworkX's `shortest_path_length`.
+      all other reachable nodes in the graph. The breadth-first searches from every 
+      node are run in compiled code (a Numba kernel if Numba is installed, otherwise 
+      `scipy.sparse.csgraph.shortest_path`).
     - Nodes that are disconnected from the rest of the graph will have a centrality 
       of 0.0.
     - This function assumes that the graph is connected; however, it gracefully 
@@ -268,26 +760,76 @@ def closeness_centrality(G):
     >>> closeness_centrality_from_scratch(G)
     {0: 0.6666666666666666, 1: 1.0, 2: 1.0, 3: 0.6666666666666666}
     """
+    if len(G) == 0: # no adjacency matrix to build
+        return {}
 
-    centrality = {}
-    N = G.number_of_nodes()  # Total number of nodes in the graph
+    nodes = _graph_arrays(G).nodes
+    N = len(nodes)  # Total number of nodes in the graph
 
-    for node_i in G.nodes():
-        # Compute shortest paths from node_i to all other nodes
-        shortest_paths = nx.shortest_path_length(G, source=node_i)
-        
-        # Sum the lengths of the shortest paths
-        total_distance = sum(shortest_paths.values())
+    # Sum the lengths of the shortest paths from every node to all reachable nodes
+    total_distance, _ = _distance_sums(G)
 
-        # Closeness centrality calculation (ignoring disconnected components)
-        if total_distance > 0 and N > 1:
-            centrality[node_i] = (N - 1) / total_distance
-        else:
-            centrality[node_i] = 0.0  # In case the node is isolated
+    # Closeness centrality calculation (ignoring disconnected components)
+    centrality = np.zeros(N)  # In case the node is isolated
+    has_paths = total_distance > 0
+    if N > 1:
+        centrality[has_paths] = (N - 1) / total_distance[has_paths]
+
+    return dict(zip(nodes, centrality.tolist()))
 
-    return centrality
+@njit(parallel=True, fastmath=True, cache=True)
+def _csr_matvec_kernel(indptr, indices, data, x, out):
+    # One row of the CSR matrix per (parallel) iteration: out[i] = sum_j A[i, j] * x[j]
+    for i in prange(len(out)):
+        s = 0.0
+        for jj in range(indptr[i], indptr[i + 1]):
+            s += data[jj] * x[indices[jj]]
+        out[i] = s
 
-def eigenvector_centrality(G, max_iter=100, tol=1e-08):
+def _csr_matvec(A, x, out):
+    """
+    Sparse matrix-vector product A @ x for a CSR matrix A.
+
+    With Numba installed the product is written into `out` by a compiled, multi-threaded
+    kernel over the CSR arrays; otherwise SciPy's SpMV is used and a new array returned.
+    """
+    if HAVE_NUMBA:
+        _csr_matvec_kernel(A.indptr, A.indices, A.data, x, out)
+        return out
+    return A @ x
+
+@njit(fastmath=True, cache=True)
+def _normalize_and_diff_kernel(x_new, x_old):
+    s = 0.0
+    for v in x_new:
+        s += v * v
+    norm = np.sqrt(s)
+    if norm == 0:
+        return 0.0, 0.0
+    inv = 1.0 / norm
+    max_diff = 0.0
+    for i in range(len(x_new)):
+        x_new[i] *= inv
+        max_diff = max(max_diff, abs(x_new[i] - x_old[i]))
+    return norm, max_diff
+
+def _normalize_and_diff(x_new, x_old):
+    """
+    Scale x_new to unit Euclidean norm in place and return (norm, max |x_new - x_old|).
+
+    With Numba installed the scaling and the convergence check share a single pass over
+    x_new; otherwise BLAS nrm2/scal are used for the norm and the in-place scaling.
+    If the norm is 0, x_new is left unchanged.
+    """
+    if HAVE_NUMBA:
+        return _normalize_and_diff_kernel(x_new, x_old)
+    norm = blas.dnrm2(x_new)
+    if norm == 0:
+        return 0.0, 0.0
+    blas.dscal(1.0 / norm, x_new)
+    return norm, np.max(np.abs(x_new - x_old))
+
+def eigenvector_centrality(G, max_iter=100, tol=1e-08, backend='auto'):
     """
     Calculate the eigenvector centrality for each node in a graph from scratch.
 
@@ -312,12 +854,26 @@ def eigenvector_centrality(G, max_iter=100, tol=1e-08):
         algorithm iterates until the change in centrality values is smaller than this
         threshold.
 
+    backend : str, optional (default='auto')
+        'cpu' always uses the power iteration below. 'cugraph' runs the calculation
+        on the GPU with `cugraph.eigenvector_centrality`. 'auto' uses cugraph only if
+        it is installed and G has more than 10^6 edges. Both backends ignore edge weights
+        and score each node by its out-neighbours (cugraph is given G reversed).
+
     Returns
     -------
     centrality : dict
         A dictionary where the keys are nodes in the graph and the values are
         their corresponding eigenvector centrality scores.
 
+    Raises
+    ------
+    ValueError
+        If backend is not 'auto', 'cugraph' or 'cpu'.
+
+    ImportError
+        If backend='cugraph' and cugraph is not installed.
+
     Notes
     -----
     - Eigenvector centrality was introduced by Bonacich (1972) as an extension 
@@ -325,7 +881,8 @@ def eigenvector_centrality(G, max_iter=100, tol=1e-08):
       or highly influential nodes. 
     - This algorithm computes eigenvector centrality using the power iteration 
       method, which involves iteratively updating the centrality scores of each 
-      node based on the scores of their neighbors until convergence.
+      node based on the scores of their neighbors until convergence. The update 
+      is performed as a sparse matrix-vector product x <- A x.
     - Eigenvector centrality works best in connected, undirected graphs; for 
       directed or disconnected graphs, results may vary or be undefined.
     - The algorithm will stop either after `max_iter` iterations or when the 
@@ -333,8 +890,9 @@ def eigenvector_centrality(G, max_iter=100, tol=1e-08):
 
     Time Complexity
     ---------------
-    The time complexity is O(V * E * I), where V is the number of vertices, 
+    The time complexity is O((V + E) * I), where V is the number of vertices, 
     E is the number of edges, and I is the number of iterations (limited by `max_iter`).
+    Each iteration is a single sparse matrix-vector product over the adjacency matrix.
 
     Citations
     ---------
@@ -351,29 +909,34 @@ def eigenvector_centrality(G, max_iter=100, tol=1e-08):
     >>> eigenvector_centrality_from_scratch(G)
     {0: 0.3730400736153818, 1: 0.2082196569730357, 2: 0.20624526357714606, ...}
     """
-    
-    # Initialize centrality dict with uniform values for all nodes
-    centrality = {node: 1.0 / len(G) for node in G}
-    N = len(G)
+    if _use_cugraph(backend, G):
+        centrality = _cugraph().eigenvector_centrality(_cugraph_input(G), max_iter=max_iter, tol=tol) # dict for nx input
+        return {node: float(value) for node, value in centrality.items()}
+    if len(G) == 0: # nothing to score (and no uniform 1/N start vector)
+        return {}
+
+    # Sparse (CSR) adjacency matrix: row i holds the neighbors of node i
+    nodes, _, A, _, _ = _graph_arrays(G)
+    N = A.shape[0]
+
+    # Initialize centrality vector with uniform values for all nodes
+    x = np.full(N, 1.0 / N)
+    x_new = np.empty(N)
 
     # Power iteration method
     for _ in range(max_iter):
-        prev_centrality = centrality.copy()
-        max_diff = 0  # Track maximum change in centrality values
-
-        for node in G:
-            # Update centrality: sum of neighbors' centralities
-            centrality[node] = sum(prev_centrality[neighbor] for neighbor in G[node])
+        # Update centrality: sum of neighbors' centralities, as one sparse mat-vec
+        x_new = _csr_matvec(A, x, x_new)
 
-        # Normalize centrality values (divide by Euclidean norm)
-        norm = np.sqrt(sum(value ** 2 for value in centrality.values()))
+        # Normalize centrality values (divide by Euclidean norm), measuring the
+        # change from the previous iteration in the same pass
+        norm, max_diff = _normalize_and_diff(x_new, x)
         if norm == 0:
-            return centrality  # Handle disconnected graphs
-        centrality = {node: value / norm for node, value in centrality.items()}
+            return dict(zip(nodes, x_new.tolist()))  # Handle disconnected graphs
 
         # Check for convergence
-        max_diff = max(abs(centrality[node] - prev_centrality[node]) for node in G)
+        x, x_new = x_new, x
         if max_diff < tol:
             break
 
-    return centrality
\ No newline at end of file
+    return dict(zip(nodes, x.tolist()))
@@ -1,6 +1,13 @@
-def bfs(explore_queue, nodes_visited, graph):
+from collections import deque
+
+import numpy as np
+
+from ._numba import HAVE_NUMBA, njit
+from .distributions import _graph_arrays
+
+def bfs(explore_queue, nodes_visited, graph, verbose=False):
     """
-    Performs a recursive breadth-first search (BFS) on a graph.
+    Performs an iterative breadth-first search (BFS) on a graph.
 
     This function explores the graph in a breadth-first manner starting from nodes
     in the `explore_queue`. It visits each node, exploring all of its neighbors 
@@ -9,13 +16,16 @@ def bfs(explore_queue, nodes_visited, graph):
 
     Parameters:
     ----------
-    explore_queue : list
-        A queue (list) of nodes to be explored. Initially contains the starting node(s).
+    explore_queue : collections.deque or list
+        A queue of nodes to be explored. Initially contains the starting node(s).
+        A list is converted to a deque so that popping from the front is O(1).
     nodes_visited : dict
         A dictionary that stores the nodes that have been visited as keys, with their 
         corresponding distances from the starting node as values.
     graph : networkx.Graph
         The graph on which the BFS is being performed. Must be a NetworkX graph object.
+    verbose : bool, optional (default=False)
+        If True, print each node as it is visited.
 
     Returns:
     -------
@@ -23,22 +33,24 @@ def bfs(explore_queue, nodes_visited, graph):
         A dictionary where keys are nodes and values are the shortest distance 
         (in terms of edge count) from the starting node.
     """
-    if len(explore_queue) == 0:
-        return nodes_visited
-    else:
-        current_node = explore_queue.pop(0)
-        print('visiting node ' + str(current_node))
-        for neighbor in G.neighbors(current_node):
+    if not isinstance(explore_queue, deque):
+        explore_queue = deque(explore_queue)
+    adj = graph.adj
+    while explore_queue:
+        current_node = explore_queue.popleft()
+        if verbose:
+            print('visiting node ' + str(current_node))
+        for neighbor in adj[current_node]:
             if neighbor in nodes_visited:
                 continue
             else:
                 nodes_visited[neighbor] = nodes_visited[current_node] + 1
                 explore_queue.append(neighbor)
-        return bfs(explore_queue, nodes_visited, graph)
+    return nodes_visited
 
-def dfs(explore_stack, nodes_visited, graph):
+def dfs(explore_stack, nodes_visited, graph, verbose=False):
     """
-    Performs a recursive depth-first search (DFS) on a graph.
+    Performs an iterative depth-first search (DFS) on a graph.
 
     This function explores the graph in a depth-first manner using a stack. It starts
     from nodes in the `explore_stack` and visits each node by going as deep as possible
@@ -54,6 +66,8 @@ def dfs(explore_stack, nodes_visited, graph):
         corresponding distances from the starting node as values.
     graph : networkx.Graph
         The graph on which the DFS is being performed. Must be a NetworkX graph object.
+    verbose : bool, optional (default=False)
+        If True, print each node as it is visited.
 
     Returns:
     -------
@@ -61,15 +75,115 @@ def dfs(explore_stack, nodes_visited, graph):
         A dictionary where keys are nodes and values are the distance (in terms of edge count) 
         from the starting node, as recorded during the depth-first exploration.
     """
-    if len(explore_stack) == 0:
-        return nodes_visited
-    else:
-        current_node = explore_stack.pop(-1)
-        print('visiting node {}'.format(str(current_node)))
-        for neighbor in G.neighbors(current_node):
+    adj = graph.adj
+    while explore_stack:
+        current_node = explore_stack.pop()
+        if verbose:
+            print('visiting node {}'.format(str(current_node)))
+        for neighbor in adj[current_node]:
             if neighbor in nodes_visited:
                 continue
             else:
                 nodes_visited[neighbor] = nodes_visited[current_node] + 1
                 explore_stack.append(neighbor)
-        return dfs(explore_stack, nodes_visited, graph)
\ No newline at end of file
+    return nodes_visited
+
+@njit(cache=True)
+def _bfs_csr_kernel(indptr, indices, source, dist, order):
+    # `order` doubles as the FIFO queue; nodes are appended as they are discovered
+    dist[source] = 0
+    order[0] = source
+    head, tail = 0, 1
+    while head < tail:
+        u = order[head]
+        head += 1
+        for jj in range(indptr[u], indptr[u + 1]):
+            v = indices[jj]
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1
+                order[tail] = v
+                tail += 1
+    return tail
+
+@njit(cache=True)
+def _dfs_csr_kernel(indptr, indices, source, dist, order):
+    # Each node is pushed at most once (when discovered), so the stack needs n slots
+    stack = np.empty(len(dist), np.int64)
+    dist[source] = 0
+    order[0] = source
+    stack[0] = source
+    top, n_found = 1, 1
+    while top > 0:
+        top -= 1
+        u = stack[top]
+        for jj in range(indptr[u], indptr[u + 1]):
+            v = indices[jj]
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1
+                order[n_found] = v
+                n_found += 1
+                stack[top] = v
+                top += 1
+    return n_found
+
+def _traverse_csr(kernel, graph, source):
+    nodes, index, _, indptr, indices = _graph_arrays(graph)
+    dist = np.full(len(nodes), -1, dtype=np.int64)
+    order = np.empty(len(nodes), dtype=np.int64)
+    n_found = kernel(indptr, indices, index[source], dist, order)
+    reached = order[:n_found]
+    return dict(zip([nodes[i] for i in reached.tolist()], dist[reached].tolist()))
+
+def bfs_csr(graph, source):
+    """
+    Performs a breadth-first search (BFS) from a single node with a compiled kernel.
+
+    Equivalent to `bfs([source], {source: 0}, graph)`, but the traversal runs in
+    Numba-compiled code over the graph's CSR adjacency arrays. Converting the graph to
+    those arrays dominates a single search, so when running many searches on the same
+    graph, do so inside `nethelp.distributions.use_graph_cache()` to convert it once. Without Numba this simply calls `bfs`.
+
+    Parameters:
+    ----------
+    graph : networkx.Graph
+        The graph on which the BFS is being performed. Must be a NetworkX graph object.
+    source : node
+        The starting node.
+
+    Returns:
+    -------
+    nodes_visited : dict
+        A dictionary where keys are nodes (in the order they were discovered) and values
+        are the shortest distance (in terms of edge count) from the source node.
+    """
+    if not HAVE_NUMBA:
+        return bfs(deque([source]), {source: 0}, graph)
+    return _traverse_csr(_bfs_csr_kernel, graph, source)
+
+def dfs_csr(graph, source):
+    """
+    Performs a depth-first search (DFS) from a single node with a compiled kernel.
+
+    Like `dfs([source], {source: 0}, graph)`, but the traversal runs in Numba-compiled
+    code over the graph's CSR adjacency arrays (see `bfs_csr` on caching them). Neighbors
+    are visited in CSR (node index) order rather than adjacency-dict order, so the
+    recorded distances can differ from `dfs` on graphs where the traversal order
+    matters. Without Numba this simply calls `dfs`.
+
+    Parameters:
+    ----------
+    graph : networkx.Graph
+        The graph on which the DFS is being performed. Must be a NetworkX graph object.
+    source : node
+        The starting node.
+
+    Returns:
+    -------
+    nodes_visited : dict
+        A dictionary where keys are nodes (in the order they were discovered) and values
+        are the distance (in terms of edge count) from the source node, as recorded
+        during the depth-first exploration.
+    """
+    if not HAVE_NUMBA:
+        return dfs([source], {source: 0}, graph)
+    return _traverse_csr(_dfs_csr_kernel, graph, source)
@@ -1,4 +1,184 @@
-def get_colorblindness_colors(hex_col, colorblind_types='all'):
+import functools
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .__about__ import __version__
+from ._numba import HAVE_NUMBA, njit, prange
+
+# requests and lxml are only needed to look up colors on convertingcolors.com
+try:
+    import requests
+except ImportError:
+    requests = None
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    from matplotlib.colors import CSS4_COLORS as namedColors
+except ImportError: # named colors (e.g. "red") are only accepted with matplotlib
+    namedColors = {}
+
+_COLORBLIND_KEYS = ('Original Color', 'Protanopia', 'Deuteranopia', 'Tritanopia',
+                    'Protanomaly', 'Deuteranomaly', 'Tritanomaly',
+                    'Achromatopsia', 'Achromatomaly', 'Grayscale')
+
+# Colorblindness simulation matrices, applied to linear (not gamma-encoded) RGB.
+# Dichromats and anomalous trichromats are from Machado, Oliveira & Fernandes (2009),
+# "A Physiologically-based Model for Simulation of Color Vision Deficiency", at
+# severity 1.0 and 0.6 respectively. Achromatopsia maps every channel to the Rec. 709
+# relative luminance; achromatomaly blends it 60/40 with the original color, matching
+# the 0.6 severity of the anomalous trichromats.
+_LUMINANCE = np.array([[0.2126, 0.7152, 0.0722]] * 3)
+COLORBLIND_MATRICES = {
+    'Protanopia': np.array([[ 0.152286,  1.052583, -0.204868],
+                            [ 0.114503,  0.786281,  0.099216],
+                            [-0.003882, -0.048116,  1.051998]]),
+    'Deuteranopia': np.array([[ 0.367322,  0.860646, -0.227968],
+                              [ 0.280085,  0.672501,  0.047413],
+                              [-0.011820,  0.042940,  0.968881]]),
+    'Tritanopia': np.array([[ 1.255528, -0.076749, -0.178779],
+                            [-0.078411,  0.930809,  0.147602],
+                            [ 0.004733,  0.691367,  0.303900]]),
+    'Protanomaly': np.array([[ 0.385450,  0.769005, -0.154455],
+                             [ 0.100526,  0.829802,  0.069673],
+                             [-0.007442, -0.022190,  1.029632]]),
+    'Deuteranomaly': np.array([[ 0.547494,  0.607765, -0.155259],
+                               [ 0.181692,  0.781742,  0.036566],
+                               [-0.010410,  0.027275,  0.983136]]),
+    'Tritanomaly': np.array([[ 1.104996, -0.046633, -0.058363],
+                             [-0.032137,  0.971635,  0.060503],
+                             [ 0.001336,  0.317922,  0.680742]]),
+    'Achromatopsia': _LUMINANCE,
+    'Achromatomaly': 0.6 * _LUMINANCE + 0.4 * np.eye(3),
+}
+
+# channel weights of the perceived lightness in lightness(), and its value for white
+_LR, _LG, _LB = 0.299, 0.587, 0.111
+_LIGHTNESS_DENOM = 255 * (_LR + _LG + _LB)**0.5
+
+# "#rrggbb", "rrggbb", "#rgb" or "rgb"; use fullmatch, since $ also matches before a trailing newline
+_HEX_RE = re.compile(r'#?(?:[0-9a-fA-F]{3}){1,2}')
+
+# "<type> ... <6 hex digits>" text of a simulated color on convertingcolors.com
+_COLORBLIND_RE = re.compile(r'(%s).*?([0-9A-Fa-f]{6})\s*$' % '|'.join(_COLORBLIND_KEYS[1:-1]),
+                            re.DOTALL)
+
+_SESSION = None # created on first use by _http_session()
+_HTTP_TIMEOUT = 5 # seconds
+
+def _http_session():
+    """
+    HTTP session used to query convertingcolors.com, created on first use. Connections
+    are kept alive and pooled across requests, and responses are gzip-compressed. If the
+    optional `requests_cache` package is installed, responses are also cached on disk
+    (in the user cache directory) for 30 days. Raises ImportError if requests or lxml
+    is not installed.
+    """
+    global _SESSION
+    missing = [name for name, module in (('requests', requests), ('lxml', lxml_html)) if module is None]
+    if missing:
+        raise ImportError("method='convertingcolors' requires the %s package%s"
+                          % (' and '.join(missing), 's' if len(missing) > 1 else ''))
+    if _SESSION is None:
+        try:
+            import requests_cache
+            session = requests_cache.CachedSession('nethelp_colorblind', use_cache_dir=True,
+                                                   expire_after=30*86400)
+        except ImportError:
+            session = requests.Session()
+        session.headers.update({'Accept-Encoding': 'gzip, deflate',
+                                'User-Agent': 'nethelp/%s' % __version__})
+        session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        _SESSION = session
+    return _SESSION
+
+def _normalize_hex(hex_col):
+    """
+    Lower-case, 6-digit hex code without the leading '#', e.g. "#FFF" -> "ffffff".
+    """
+    hex_clean = hex_col.lstrip('#').lower()
+    if len(hex_clean) == 3:
+        hex_clean = ''.join(c*2 for c in hex_clean)
+    return hex_clean
+
+def _parse_color(hex_col):
+    """
+    Validate a color given as a hex code, an (R, G, B) tuple or a color name in
+    namedColors. Returns the color as a hex code (as given, if it was one) and its
+    normalized form (see `_normalize_hex`), or raises ValueError.
+    """
+    if not isinstance(hex_col, str):
+        if len(hex_col)!=3:
+            raise ValueError('Input a hex color or an (R, G, B) tuple please, got %r' % (hex_col,))
+        hex_col = rgb_to_hex(hex_col)
+    elif not _HEX_RE.fullmatch(hex_col):
+        if hex_col.lower() not in namedColors:
+            raise ValueError('Input a hex color please, got %r' % hex_col)
+        hex_col = namedColors[hex_col.lower()]
+    return hex_col, _normalize_hex(hex_col)
+
+def _rgb_array_to_hex(rgb):
+    """
+    Hex codes of an (..., 3) uint8 array of RGB colors, in C order, formatted from a
+    single hex dump of the array rather than one rgb_to_hex call per color.
+    """
+    hex_all = np.ascontiguousarray(rgb, dtype=np.uint8).tobytes().hex()
+    return ['#' + hex_all[i:i+6] for i in range(0, len(hex_all), 6)]
+
+def _simulate_colorblindness(hex_col, colorblind_types=COLORBLIND_MATRICES):
+    """
+    Simulate the given types (by default every type in COLORBLIND_MATRICES) for one
+    color, entirely locally.
+
+    Returns
+    -------
+    dict
+        Colorblindness type -> simulated hex code.
+    """
+    rgb = np.array(hex_to_rgb(hex_col), dtype=np.float64) / 255
+    lin = srgb_to_linear(rgb)
+    out = {}
+    for name in colorblind_types:
+        sim = np.round(linear_to_srgb(COLORBLIND_MATRICES[name] @ lin) * 255).astype(int)
+        out[name] = rgb_to_hex(tuple(sim.tolist()))
+    return out
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_colorblind_colors(hex_clean):
+    """
+    Download the colorblindness simulations for a color from convertingcolors.com.
+
+    Results are memoized per normalized hex code (see `_normalize_hex`), so each color
+    is only requested once per session.
+
+    Returns
+    -------
+    tuple of (str, str)
+        (colorblindness type, "#" + hex code) pairs, in page order, for each type
+        found in the page's blindness-simulation section.
+    """
+    hex_url = 'https://convertingcolors.com/hex-color-%s.html'%hex_clean
+    reqs = _http_session().get(hex_url, timeout=_HTTP_TIMEOUT)
+    tree = lxml_html.fromstring(reqs.text)
+
+    colorblind_sec = tree.get_element_by_id('blindness-simulation')
+    # one pass over the section's divs, keeping the first color found for each type
+    colorblind_colors = {}
+    for div in colorblind_sec.iter('div'):
+        text = div.text_content()
+        if _COLORBLIND_KEYS[0] in text:
+            continue
+        m = _COLORBLIND_RE.search(text)
+        if m is not None:
+            colorblind_colors.setdefault(m.group(1), '#' + m.group(2))
+    return tuple(colorblind_colors.items())
+
+def get_colorblindness_colors(hex_col, colorblind_types='all', method='simulate'):
     """
     Generates color representations for various types of colorblindness.
 
@@ -6,7 +186,8 @@ def get_colorblindness_colors(hex_col, colorblind_types='all'):
     ----------
     hex_col (str or tuple)
         The color you wish to check, in hex code format e.g. "#ffffff" or rgb
-        format e.g. (1,255,20)
+        format e.g. (1,255,20). If matplotlib is installed, CSS color names
+        e.g. "red" are also accepted.
 
     colorblind_types (str or list)
         If "all", the function returns a dictionary with all of the following:
@@ -27,73 +208,166 @@ def get_colorblindness_colors(hex_col, colorblind_types='all'):
             Achromatomaly - ("Monochromat" family)
                 The viewer sees low amounts of color.
 
+    method (str)
+        "simulate" (default) computes the colors locally by applying the
+        simulation matrices in COLORBLIND_MATRICES to the linear RGB color
+        (Machado et al., 2009). "convertingcolors" instead looks the color up
+        on convertingcolors.com, which needs network access and the requests
+        and lxml packages.
+
     Returns
     -------
     colorblind_output (dict)
         dictionary where the keys are the type of colorblindness and the values
         are the re-colored version of your original hex_col. This also includes
-        a grayscale version of the color.
+        the grayscale value of the color (a float from 0 to 1, see hex_to_grayscale).
+
+    Raises
+    ------
+    ValueError
+        If hex_col is not a hex code, an (R, G, B) tuple or a known color name,
+        or colorblind_types contains an unknown type.
+
+    ImportError
+        If method="convertingcolors" and requests or lxml is not installed.
     """
-    all_vals = ['Original Color', 'Protanopia', 'Deuteranopia',
-                'Protanomaly', 'Deuteranomaly',
-                'Achromatopsia', 'Achromatomaly', 'Grayscale']
+    all_vals = _COLORBLIND_KEYS
+    hex_col, hex_clean = _parse_color(hex_col)
 
-    if type(hex_col)!=str:
-        if len(hex_col)!=3:
-            print('Input a hex color please.')
-            return ''
+    if colorblind_types!='all':
+        if type(colorblind_types) == str:
+            colorblind_types = [colorblind_types]
+        unknown = [c for c in colorblind_types if c not in all_vals]
+        if unknown:
+            raise ValueError('Unknown colorblind_types %s, choose from: %s' % (unknown, ', '.join(all_vals)))
+        # 'Original Color' and 'Grayscale' are always included, so only simulate the rest
+        colorblind_types = [c for c in colorblind_types if c in COLORBLIND_MATRICES]
+
+    colorblind_output = {"Original Color":hex_col}
+
+    # only the requested types are simulated / copied over
+    if method == 'simulate':
+        if colorblind_types=='all':
+            colorblind_output.update(_simulate_colorblindness(hex_clean))
+        else:
+            colorblind_output.update(_simulate_colorblindness(hex_clean, colorblind_types))
+    elif method == 'convertingcolors':
+        # one page holds every type, so it is fetched and cached whole
+        colorblind_colors = _fetch_colorblind_colors(hex_clean) # cached per color
+        if colorblind_types=='all':
+            colorblind_output.update(colorblind_colors)
         else:
-            hex_col = rgb_to_hex(hex_col)
+            colorblind_colors = dict(colorblind_colors)
+            for c in colorblind_types:
+                if c in colorblind_colors: # types missing from the page are filled in below
+                    colorblind_output[c] = colorblind_colors[c]
     else:
-        if "#" not in hex_col and len(hex_col)!=6:
-            try:
-                hex_col = namedColors[hex_col]
-            except:
-                print('Input a hex color please.')
-                return ''
-
-    base_url = 'https://convertingcolors.com/'
-    hex_url = base_url + 'hex-color-%s.html'%hex_col.replace("#",'')
-    print(hex_url)
-    reqs = requests.get(hex_url)
-    soup = BeautifulSoup(reqs.text, 'html.parser')
-
-    colorblind_sec = soup.find_all('details',{'id':'blindness-simulation'})[0]
-    colorblind_labels = [i.text for i in colorblind_sec.find_all('h3')]
-    # colorblind_colors = np.unique([i.text for i in colorblind_sec.find_all('div')])
-    tmp = np.unique([i.text for i in colorblind_sec.find_all('div')])
-    colorblind_colors = [i for i in tmp for x in all_vals[1:] if x in i and all_vals[0] not in i]
+        raise ValueError("method must be either 'simulate' or 'convertingcolors'")
 
-    colorblind_output = {"Original Color":hex_col}
+    colorblind_output['Grayscale'] = hex_to_grayscale(hex_clean)
+    for xx in all_vals: # types not requested (or not found) keep the original color
+        colorblind_output.setdefault(xx, hex_col)
 
-    # for i in colorblind_mappings.keys():
-    #     for j in colorblind_colors:
-    #         # if i in j:
-    #         hex_col_j = j
-    #         colorblind_output[i] = hex_col_j
-    for i in colorblind_mappings.keys():
-        for j in colorblind_colors:
-            if i in j:
-                hex_col_j = "#"+j.split('%')[-1]
-                # hex_col_j = j.replace(i,'#')
-                colorblind_output[i] = hex_col_j
+    return colorblind_output
 
-    if colorblind_types!='all':
-        if type(colorblind_types) == str:
-            colorblind_types = [colorblind_types]
+def get_colorblindness_colors_batch(hex_array):
+    """
+    Simulates many colors at once for every type of colorblindness. Gives the same
+    result as {h: get_colorblindness_colors(h) for h in hex_array} with the default
+    "simulate" method, but decodes all colors into one (N, 3) array and applies each
+    simulation matrix with a single matrix product instead of looping over colors
+    in Python.
 
-        new_out = {'Original Color':hex_col}
-        for c in colorblind_types:
-            new_out[c] = colorblind_output[c]
+    Parameters
+    ----------
+    hex_array (list or numpy.ndarray)
+        The colors you wish to check, in any format get_colorblindness_colors
+        accepts. They are used as dictionary keys, so (R, G, B) colors must be
+        given as tuples.
+
+    Returns
+    -------
+    dict
+        dictionary where the keys are the input colors and each value is the
+        dictionary get_colorblindness_colors would give for that color (type of
+        colorblindness -> re-colored hex code, plus the original and grayscale).
+
+    Raises
+    ------
+    ValueError
+        If any of the colors is not a hex code, an (R, G, B) tuple or a known
+        color name.
+    """
+    hex_array = list(hex_array)
+    parsed = [_parse_color(h) for h in hex_array] # validate everything before decoding
+    rgb8 = np.frombuffer(bytes.fromhex(''.join(hex_clean for _, hex_clean in parsed)),
+                         dtype=np.uint8).reshape(-1, 3)
+    lin = srgb_to_linear(rgb8 / 255)
+
+    sim = np.empty((len(COLORBLIND_MATRICES),) + lin.shape)
+    for i, M in enumerate(COLORBLIND_MATRICES.values()):
+        np.matmul(lin, M.T, out=sim[i])
+    sim = np.round(linear_to_srgb(sim) * 255).astype(np.uint8)
+
+    hex_sim = _rgb_array_to_hex(sim)
+    n = len(hex_array)
+    hex_sim = dict(zip(COLORBLIND_MATRICES, (hex_sim[i*n:(i+1)*n] for i in range(len(COLORBLIND_MATRICES)))))
+
+    R, G, B = rgb8.astype(np.float64).T
+    gray = ((0.2989 * R + 0.5870 * G + 0.1140 * B) / 255).tolist()
+
+    output = {}
+    for k, (h, (hex_col, _)) in enumerate(zip(hex_array, parsed)):
+        colorblind_output = {"Original Color":hex_col}
+        for name, cols in hex_sim.items():
+            colorblind_output[name] = cols[k]
+        colorblind_output['Grayscale'] = gray[k]
+        output[h] = colorblind_output
+
+    return output
+
+def get_colorblindness_colors_many(hex_list, max_workers=8, colorblind_types='all',
+                                   method='simulate'):
+    """
+    Generates the colorblindness colors of many colors. With method="convertingcolors",
+    the pages of all distinct colors are downloaded concurrently from a pool of
+    threads, since each lookup waits on the network; with the default "simulate"
+    method, get_colorblindness_colors_batch gives the same result faster.
 
-        colorblind_output = new_out
+    Parameters
+    ----------
+    hex_list (list)
+        The colors you wish to check, in any format get_colorblindness_colors
+        accepts. They are used as dictionary keys, so (R, G, B) colors must be
+        given as tuples.
+
+    max_workers (int)
+        Maximum number of downloads in flight at once.
 
-    colorblind_output['Grayscale'] = hex_to_grayscale(hex_col)
-    for xx in all_vals:
-        if xx not in list(colorblind_output.keys()):
-            colorblind_output[xx] = hex_col
+    colorblind_types (str or list), method (str)
+        Passed on to get_colorblindness_colors.
 
-    return {hex_col:colorblind_output}
+    Returns
+    -------
+    dict
+        dictionary where the keys are the input colors and each value is the
+        dictionary get_colorblindness_colors gives for that color.
+    """
+    hex_list = list(hex_list)
+    if method == 'convertingcolors':
+        # download each distinct color once (e.g. "#FFF" and "ffffff" share a page);
+        # the results below are then served from _fetch_colorblind_colors' cache
+        hex_cleans = list(dict.fromkeys(_parse_color(h)[1] for h in hex_list))
+        _http_session() # create the shared session up front, not from several threads
+        with ThreadPoolExecutor(max_workers) as ex:
+            list(ex.map(_fetch_colorblind_colors, hex_cleans))
+
+    results = {}
+    for h in hex_list:
+        if h not in results:
+            results[h] = get_colorblindness_colors(h, colorblind_types, method)
+
+    return results
 
 def rgb_to_hsv(rgb):
     """
@@ -107,29 +381,78 @@ def rgb_to_hsv(rgb):
 
     Returns
     -------
-    numpy.ndarray
-        An array representing the HSV equivalent of the input RGB values.
-    """
-    rgb = np.array(rgb)
-    rgb = rgb.astype('float')
-    maxv = np.amax(rgb)
-    maxc = np.argmax(rgb)
-    minv = np.amin(rgb)
-    minc = np.argmin(rgb)
-
-    hsv = np.zeros(rgb.shape, dtype='float')
-    hsv[maxc == minc, 0] = np.zeros(hsv[maxc == minc, 0].shape)
-    hsv[maxc == 0, 0] = (((rgb[..., 1] - rgb[..., 2]) * 60.0 /\
-                          (maxv - minv + np.spacing(1))) % 360.0)[maxc == 0]
-    hsv[maxc == 1, 0] = (((rgb[..., 2] - rgb[..., 0]) * 60.0 /\
-                          (maxv - minv + np.spacing(1))) + 120.0)[maxc == 1]
-    hsv[maxc == 2, 0] = (((rgb[..., 0] - rgb[..., 1]) * 60.0 /\
-                          (maxv - minv + np.spacing(1))) + 240.0)[maxc == 2]
-    hsv[maxv == 0, 1] = np.zeros(hsv[maxv == 0, 1].shape)
-    hsv[maxv != 0, 1] = (1 - minv / (maxv + np.spacing(1)))[maxv != 0]
-    hsv[..., 2] = maxv/255
-
-    return hsv
+    tuple of floats
+        The HSV equivalent of the input RGB values: hue in degrees (0 to 360),
+        saturation and value (0 to 1).
+    """
+    r, g, b = (float(c) for c in rgb)
+    maxv = max(r, g, b)
+    minv = min(r, g, b)
+    delta = maxv - minv
+
+    if delta == 0: # grays have no hue
+        h = 0.0
+    elif maxv == r:
+        h = ((g - b) * 60.0 / delta) % 360.0
+    elif maxv == g:
+        h = (b - r) * 60.0 / delta + 120.0
+    else:
+        h = (r - g) * 60.0 / delta + 240.0
+    s = 0.0 if maxv == 0 else delta / maxv
+
+    return (h, s, maxv / 255)
+
+@njit(parallel=True, cache=True)
+def _rgb_to_hsv_batch_kernel(rgb, out):
+    for i in prange(rgb.shape[0]):
+        r, g, b = rgb[i, 0], rgb[i, 1], rgb[i, 2]
+        maxv = max(r, g, b)
+        delta = maxv - min(r, g, b)
+        if delta == 0:
+            h = 0.0
+        elif maxv == r:
+            h = ((g - b) * 60.0 / delta) % 360.0
+        elif maxv == g:
+            h = (b - r) * 60.0 / delta + 120.0
+        else:
+            h = (r - g) * 60.0 / delta + 240.0
+        out[i, 0] = h
+        out[i, 1] = 0.0 if maxv == 0 else delta / maxv
+        out[i, 2] = maxv / 255
+
+def rgb_to_hsv_batch(rgb):
+    """
+    Converts many RGB colors to HSV format at once, giving the same values as
+    rgb_to_hsv for each color. With Numba installed this runs as a compiled,
+    multi-threaded loop; otherwise it is vectorized with NumPy.
+
+    Parameters
+    ----------
+    rgb : array-like, shape (N, 3)
+        The RGB values (R, G, B) of N colors, each in the range 0 to 255.
+
+    Returns
+    -------
+    numpy.ndarray, shape (N, 3)
+        The hue in degrees (0 to 360), saturation and value (0 to 1) of each color.
+    """
+    rgb = np.ascontiguousarray(rgb, dtype=np.float64).reshape(-1, 3)
+    if HAVE_NUMBA:
+        hsv = np.empty_like(rgb)
+        _rgb_to_hsv_batch_kernel(rgb, hsv)
+        return hsv
+
+    r, g, b = rgb.T
+    maxv = rgb.max(axis=1)
+    delta = maxv - rgb.min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.where(maxv == r, ((g - b) * 60.0 / delta) % 360.0,
+                     np.where(maxv == g, (b - r) * 60.0 / delta + 120.0,
+                              (r - g) * 60.0 / delta + 240.0))
+        s = np.where(maxv == 0, 0.0, delta / maxv)
+    h[delta == 0] = 0.0 # grays have no hue
+
+    return np.stack((h, s, maxv / 255), axis=1)
 
 def lightness(hex_col):
     """
@@ -145,13 +468,29 @@ def lightness(hex_col):
     float
         The perceived lightness of the color, ranging from 0 (dark) to 1 (light).
     """    
-    rgb = hex_to_rgb(hex_col)
-    r,g,b = rgb
-    denominator = 255 * (0.299 + 0.587 + 0.111)**(0.5)
-    L = (0.299 * r**2 + 0.587 * g**2 + 0.111 * b**2)**(0.5) / denominator
+    r,g,b = hex_to_rgb(hex_col)
+    L = math.sqrt(_LR * r*r + _LG * g*g + _LB * b*b) / _LIGHTNESS_DENOM
 
     return L
 
+@functools.lru_cache(maxsize=1024)
+def hex_to_hsv(hex_col):
+    """
+    Converts a hex color code to HSV format. Results are cached, so sorting a palette
+    by both hue and saturation only converts each color once.
+
+    Parameters
+    ----------
+    hex_col : str
+        A hex code representing the color (e.g., "#ffffff").
+
+    Returns
+    -------
+    tuple of floats
+        The hue in degrees (0 to 360), saturation and value (0 to 1).
+    """
+    return rgb_to_hsv(hex_to_rgb(hex_col))
+
 def saturation(hex_col):
     """
     Calculates the saturation of a given hex color.
@@ -166,9 +505,7 @@ def saturation(hex_col):
     float
         The saturation value ranging from 0 (unsaturated, grayscale) to 1 (fully saturated).
     """
-    hsv = rgb_to_hsv(hex_to_rgb(hex_col))
-
-    return hsv[1]
+    return hex_to_hsv(hex_col)[1]
 
 def hue(hex_col):
     """
@@ -184,9 +521,7 @@ def hue(hex_col):
     float
         The hue value in degrees, ranging from 0 to 360.
     """
-    hsv = rgb_to_hsv(hex_to_rgb(hex_col))
-
-    return hsv[0]
+    return hex_to_hsv(hex_col)[0]
 
 def rgb_to_hex(rgb):
     """
@@ -205,16 +540,18 @@ def rgb_to_hex(rgb):
     """
     r,g,b=rgb
 
-    return '#%02x%02x%02x' % (r,g,b)
+    return '#' + bytes((r,g,b)).hex()
 
+@functools.lru_cache(maxsize=4096)
 def hex_to_rgb(value):
     """
-    Converts a hex color code to an RGB tuple.
+    Converts a hex color code to an RGB tuple. Results are cached, so lightness,
+    hue, saturation and hex_to_grayscale on the same color only parse it once.
 
     Parameters
     ----------
     value : str
-        A hex code representing the color (e.g., "#ffffff").
+        A hex code representing the color (e.g., "#ffffff" or "#fff").
 
     Returns
     -------
@@ -222,9 +559,10 @@ def hex_to_rgb(value):
         A tuple containing the RGB values (R, G, B) where each value is in the range 0 to 255.
     """
     value = value.lstrip('#')
-    lv = len(value)
+    if len(value) == 3: # shorthand, e.g. "#fff"
+        value = value[0]*2 + value[1]*2 + value[2]*2
 
-    return tuple(int(value[i:i+lv//3], 16) for i in range(0, lv, lv//3))
+    return tuple(bytes.fromhex(value))
 
 def hex_to_grayscale(hex_col):
     """
@@ -237,11 +575,46 @@ def hex_to_grayscale(hex_col):
 
     Returns
     -------
-    str
-        The grayscale value of the color as a normalized float (0.0 to 1.0).
+    float
+        The grayscale value of the color, normalized from 0.0 (black) to 1.0 (white).
+    """
+    R, G, B = hex_to_rgb(hex_col)
+    imgGray = 0.2989 * R + 0.5870 * G + 0.1140 * B
+
+    return imgGray/255
+
+def srgb_to_linear(rgb):
+    """
+    Converts gamma-encoded sRGB values to linear RGB.
+
+    Parameters
+    ----------
+    rgb : array-like of floats
+        sRGB values in the range 0 to 1.
+
+    Returns
+    -------
+    numpy.ndarray
+        The linear RGB values, in the range 0 to 1.
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+def linear_to_srgb(lin):
+    """
+    Converts linear RGB values to gamma-encoded sRGB.
+
+    Parameters
+    ----------
+    lin : array-like of floats
+        Linear RGB values. Values outside 0 to 1 are clipped.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sRGB values, in the range 0 to 1.
     """
-    img = hex_to_rgb(hex_col)
-    R, G, B = img
-    imgGray = 0.2989 * R + 0.5870 * G + 0.1140 * B    
+    lin = np.clip(np.asarray(lin, dtype=np.float64), 0, 1)
 
-    return '%.7f'%(imgGray/255)
\ No newline at end of file
+    return np.where(lin <= 0.0031308, lin * 12.92, 1.055 * lin ** (1 / 2.4) - 0.055)
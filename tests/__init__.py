@@ -0,0 +1,3 @@
+# SPDX-FileCopyrightText: 2024-present Nima Moghaddas <n.r.moghaddas@gmail.com>
+#
+# SPDX-License-Identifier: MIT
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2024-present Nima Moghaddas <n.r.moghaddas@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import gc
+import types
+import weakref
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from nethelp import distributions
+from nethelp.distributions import (KatzSolver, _graph_arrays,
+                                   average_shortest_path_length_per_node,
+                                   calculate_katz_centrality, closeness_centrality,
+                                   eigenvector_centrality, use_graph_cache)
+
+
+def test_katz_solver_update_edge_matches_refactorization():
+    G = nx.path_graph(30)
+    solver = KatzSolver(G, alpha=0.2)
+    solver.centrality() # cached before the update, which must invalidate it
+    solver.update_edge(0, 29)
+    solver.update_edge(3, 17, weight=0.5)
+
+    H = G.copy()
+    H.add_edge(0, 29)
+    H.add_edge(3, 17, weight=0.5)
+    np.testing.assert_allclose(solver.centrality(), KatzSolver(H, alpha=0.2).centrality(),
+                               rtol=0, atol=1e-12)
+
+
+def test_graph_changes_are_not_served_stale():
+    G = nx.star_graph(5)
+    closeness_centrality(G)
+    G.remove_edge(0, 1)
+    G.add_edge(2, 1) # same node and edge counts
+    assert closeness_centrality(G) == pytest.approx(nx.closeness_centrality(G))
+
+
+def test_shortest_path_measures_of_empty_graph():
+    assert closeness_centrality(nx.Graph()) == {}
+    assert average_shortest_path_length_per_node(nx.Graph()) == {}
+
+
+def test_use_graph_cache_converts_once_and_drops_dead_graphs():
+    G = nx.karate_club_graph()
+    with use_graph_cache():
+        assert _graph_arrays(G) is _graph_arrays(G)
+        ref = weakref.ref(G)
+        del G
+        gc.collect()
+        assert ref() is None
+    assert distributions._GRAPH_CACHE is None
+
+
+def test_eigenvector_centrality_counts_parallel_edges_once():
+    G = nx.MultiGraph(nx.path_graph(4))
+    G.add_edges_from([(0, 1), (0, 1)])
+    expected = eigenvector_centrality(nx.path_graph(4))
+    assert eigenvector_centrality(G) == pytest.approx(expected)
+    assert expected == pytest.approx(nx.eigenvector_centrality(nx.path_graph(4)), abs=1e-6)
+
+
+@pytest.fixture
+def fake_cugraph(monkeypatch):
+    # stands in for cugraph with NetworkX, which also reads 'weight' and scores in-edges
+    fake = types.SimpleNamespace(
+        katz_centrality=lambda G, alpha, max_iter, tol: nx.katz_centrality(
+            G, alpha=alpha, max_iter=max_iter, tol=tol, weight='weight'),
+        eigenvector_centrality=lambda G, max_iter, tol: nx.eigenvector_centrality(
+            G, max_iter=10 * max_iter, tol=tol, weight='weight'))
+    monkeypatch.setattr(distributions, '_cugraph', lambda: fake)
+
+
+def test_cugraph_backend_matches_cpu(fake_cugraph):
+    G = nx.MultiGraph(nx.karate_club_graph()) # Katz is weighted on both backends
+    G.add_edge(0, 1, weight=3)
+    assert calculate_katz_centrality(G, 0.01, backend='cugraph') == pytest.approx(
+        calculate_katz_centrality(G, 0.01, backend='cpu'))
+
+    # eigenvector centrality is unweighted and sums over out-neighbours on the CPU
+    D = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 0), (1, 3)])
+    nx.set_edge_attributes(D, 5.0, 'weight')
+    D[0][1]['weight'] = 0.1
+    cpu = eigenvector_centrality(D, max_iter=1000, backend='cpu')
+    assert eigenvector_centrality(D, max_iter=1000, backend='cugraph') == pytest.approx(cpu, abs=1e-6)
+
+
+def test_eigenvector_centrality_of_empty_graph():
+    assert eigenvector_centrality(nx.Graph()) == {}
+
+
+@pytest.mark.parametrize('method', ['solve', 'power', 'iterative'])
+def test_katz_centrality_node_lookup(method):
+    G = nx.karate_club_graph()
+    result = calculate_katz_centrality(G, 0.01, method=method)
+    node_value = calculate_katz_centrality(G, 0.01, node=0, method=method)
+    assert isinstance(node_value, float)
+    assert node_value == result[0]
+
+    # string labels, inserted out of order, must map to their own rows
+    H = nx.relabel_nodes(nx.path_graph(6), {i: 'n%d' % (5 - i) for i in range(6)})
+    H.add_edge('n5', 'x')
+    expected = nx.katz_centrality(H, alpha=0.1, tol=1e-12)
+    top = max(expected.values())
+    for label in H:
+        assert calculate_katz_centrality(H, 0.1, node=label, method=method) == pytest.approx(
+            expected[label] / top, rel=1e-5)
+
+
+def test_degree_distribution():
+    G = nx.erdos_renyi_graph(100, 0.05, seed=0)
+    x, probs = distributions.degree_distribution(G)
+    assert x.shape == probs.shape == (15,)
+
+    # star with 4 leaves: degrees 4, 1, 1, 1, 1 in unit-width bins [0, 1), ..., [4, 5]
+    x, counts = distributions.degree_distribution(nx.star_graph(4), number_of_bins=5,
+                                                  log_binning=False, density=False)
+    assert x.tolist() == [0.5, 1.5, 2.5, 3.5, 4.5]
+    assert counts.tolist() == [0, 4, 0, 0, 1]
+
+
+@pytest.mark.parametrize('log_binning', [True, False])
+@pytest.mark.parametrize('density', [True, False])
+@pytest.mark.parametrize('number_of_bins', [1, 7, 15, 40])
+@pytest.mark.parametrize('directed', [False, 'in', 'out'])
+def test_degree_distribution_matches_histogram(log_binning, density, number_of_bins, directed):
+    G = nx.gnm_random_graph(300, 1500, seed=4, directed=True)
+    G.add_edges_from((0, v) for v in range(1, 60)) # a hub far from the other degrees
+    degrees = {False: G.degree, 'in': G.in_degree, 'out': G.out_degree}[directed]
+    k = [d for _, d in degrees()]
+    kmax = max(k)
+    if log_binning:
+        bins = np.logspace(0, np.log10(kmax + 1), number_of_bins + 1)
+    else:
+        bins = np.linspace(0, kmax + 1, num=number_of_bins + 1)
+    expected, _ = np.histogram(k, bins, density=density)
+
+    x, probs = distributions.degree_distribution(G, number_of_bins, log_binning, density, directed)
+    assert x == pytest.approx(bins[1:] - np.diff(bins) / 2)
+    assert probs == pytest.approx(expected)
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2024-present Nima Moghaddas <n.r.moghaddas@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import networkx as nx
+
+from nethelp.search import bfs, dfs
+
+
+def test_bfs_and_dfs_on_deep_graphs():
+    # far deeper than the recursion limit
+    G = nx.path_graph(5000)
+    expected = dict(enumerate(range(5000)))
+    assert bfs([0], {0: 0}, G) == expected
+    assert dfs([0], {0: 0}, G) == expected
+
+    G = nx.gnm_random_graph(2000, 3000, seed=2)
+    assert bfs([0], {0: 0}, G) == nx.single_source_shortest_path_length(G, 0)
+    assert dfs([0], {0: 0}, G).keys() == nx.node_connected_component(G, 0)
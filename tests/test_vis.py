@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2024-present Nima Moghaddas <n.r.moghaddas@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+import nethelp
+
+
+def test_hex_to_rgb():
+    assert nethelp.vis.hex_to_rgb('ffffff') == (255, 255, 255)
+
+
+def test_colorblindness_batch_matches_single():
+    colors = ['#ff0000', '#12AB40', 'fff', '0a1b2c', (10, 20, 30)]
+    expected = {h: nethelp.vis.get_colorblindness_colors(h) for h in colors}
+    assert nethelp.vis.get_colorblindness_colors_batch(colors) == expected
+
+
+def test_colorblindness_batch_rejects_bad_input():
+    with pytest.raises(ValueError):
+        nethelp.vis.get_colorblindness_colors_batch(['#abcd', '#ef1234ab'])
+    with pytest.raises(ValueError):
+        nethelp.vis.get_colorblindness_colors_batch(['ffffff\n'])
+    with pytest.raises(ValueError):
+        nethelp.vis.get_colorblindness_colors('ffffff\n')
+
+
+def test_colorblindness_subset():
+    full = nethelp.vis.get_colorblindness_colors('#12ab40')
+    sub = nethelp.vis.get_colorblindness_colors('#12ab40', colorblind_types=['Original Color', 'Tritanopia'])
+    assert sub['Tritanopia'] == full['Tritanopia']
+    assert sub['Protanopia'] == '#12ab40'
+    with pytest.raises(ValueError):
+        nethelp.vis.get_colorblindness_colors('#12ab40', colorblind_types='Nope')